@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import shutil
 from pathlib import Path
@@ -6,10 +7,15 @@ from src import __version__
 
 BENCHMARK_EXE_NAME = "d4lf_benchmark.exe"
 EXE_NAME = "d4lf.exe"
+# Modules that are compiled with Cython before bundling. Set SKIP_CYTHON=1 to ship them as pure python
+CYTHON_MODULES = [Path("src/config/models.py")]
+# Cython extensions hide their imports from PyInstaller's analysis
+CYTHON_HIDDEN_IMPORTS = ["pydantic_numpy", "pydantic_numpy.model"]
 
 
-def build(release_dir: Path):
-    installer_cmd = f"pyinstaller --clean --onefile --distpath {release_dir} --paths src src\\main.py"
+def build(release_dir: Path, hidden_imports: list[str]):
+    hidden_import_args = "".join(f" --hidden-import {x}" for x in hidden_imports)
+    installer_cmd = f"pyinstaller --clean --onefile --distpath {release_dir} --paths src{hidden_import_args} src\\main.py"
     os.system(installer_cmd)
     (release_dir / "main.exe").rename(release_dir / EXE_NAME)
 
@@ -25,6 +31,25 @@ def clean_up():
         shutil.rmtree(build_dir)
     for p in Path.cwd().glob("*.spec"):
         p.unlink()
+    for module in CYTHON_MODULES:
+        module.with_suffix(".c").unlink(missing_ok=True)
+        for p in module.parent.glob(f"{module.stem}.*.pyd"):
+            p.unlink()
+
+
+def compile_modules() -> bool:
+    if os.environ.get("SKIP_CYTHON") == "1":
+        print("SKIP_CYTHON is set, bundling pure python modules")
+        return False
+    if importlib.util.find_spec("Cython") is None:
+        print("Cython is not installed, bundling pure python modules")
+        return False
+    for module in CYTHON_MODULES:
+        if os.system(f"cythonize --inplace -3 {module}") != 0:
+            print(f"Compiling {module} failed, bundling pure python modules")
+            clean_up()
+            return False
+    return True
 
 
 def copy_additional_resources(release_dir: Path):
@@ -48,8 +73,12 @@ if __name__ == "__main__":
         shutil.rmtree(RELEASE_DIR.absolute())
     RELEASE_DIR.mkdir(exist_ok=True, parents=True)
     clean_up()
-    build(release_dir=RELEASE_DIR)
-    # build_benchmark(release_dir=RELEASE_DIR)
-    copy_additional_resources(RELEASE_DIR)
-    create_batch_for_gui(release_dir=RELEASE_DIR, exe_name=EXE_NAME)
-    clean_up()
+    # Compiled modules left in the source tree would shadow the python modules when running from source
+    try:
+        compiled = compile_modules()
+        build(release_dir=RELEASE_DIR, hidden_imports=CYTHON_HIDDEN_IMPORTS if compiled else [])
+        # build_benchmark(release_dir=RELEASE_DIR)
+        copy_additional_resources(RELEASE_DIR)
+        create_batch_for_gui(release_dir=RELEASE_DIR, exe_name=EXE_NAME)
+    finally:
+        clean_up()
@@ -15,15 +15,15 @@ from src.utils.image_operations import alpha_to_mask
 LOGGER = logging.getLogger("d4lf")
 
 COLORS = ColorsModel(
-    aspect_number=HSVRangeModel(h_s_v_min=np.array([90, 60, 200]), h_s_v_max=np.array([150, 100, 255])),
-    cold_imbued=HSVRangeModel(h_s_v_min=np.array([88, 0, 0]), h_s_v_max=np.array([112, 255, 255])),
-    legendary_orange=HSVRangeModel(h_s_v_min=np.array([4, 190, 190]), h_s_v_max=np.array([26, 255, 255])),
-    material_color=HSVRangeModel(h_s_v_min=np.array([86, 110, 190]), h_s_v_max=np.array([114, 220, 255])),
-    poison_imbued=HSVRangeModel(h_s_v_min=np.array([55, 0, 0]), h_s_v_max=np.array([65, 255, 255])),
-    shadow_imbued=HSVRangeModel(h_s_v_min=np.array([120, 0, 0]), h_s_v_max=np.array([140, 255, 255])),
-    skill_cd=HSVRangeModel(h_s_v_min=np.array([5, 61, 38]), h_s_v_max=np.array([16, 191, 90])),
-    unique_gold=HSVRangeModel(h_s_v_min=np.array([4, 45, 125]), h_s_v_max=np.array([26, 155, 250])),
-    unusable_red=HSVRangeModel(h_s_v_min=np.array([0, 210, 110]), h_s_v_max=np.array([10, 255, 210])),
+    aspect_number=HSVRangeModel(h_s_v_min=(90, 60, 200), h_s_v_max=(150, 100, 255)),
+    cold_imbued=HSVRangeModel(h_s_v_min=(88, 0, 0), h_s_v_max=(112, 255, 255)),
+    legendary_orange=HSVRangeModel(h_s_v_min=(4, 190, 190), h_s_v_max=(26, 255, 255)),
+    material_color=HSVRangeModel(h_s_v_min=(86, 110, 190), h_s_v_max=(114, 220, 255)),
+    poison_imbued=HSVRangeModel(h_s_v_min=(55, 0, 0), h_s_v_max=(65, 255, 255)),
+    shadow_imbued=HSVRangeModel(h_s_v_min=(120, 0, 0), h_s_v_max=(140, 255, 255)),
+    skill_cd=HSVRangeModel(h_s_v_min=(5, 61, 38), h_s_v_max=(16, 191, 90)),
+    unique_gold=HSVRangeModel(h_s_v_min=(4, 45, 125), h_s_v_max=(26, 155, 250)),
+    unusable_red=HSVRangeModel(h_s_v_min=(0, 210, 110), h_s_v_max=(10, 255, 210)),
 )
 
 POSITIONS = (
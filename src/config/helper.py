@@ -1,5 +1,6 @@
 """New config loading and verification using pydantic. For now, both will exist in parallel hence _new."""
 
+import functools
 import threading
 
 import keyboard
@@ -11,6 +12,7 @@ def check_greater_than_zero(v: int) -> int:
     return v
 
 
+@functools.lru_cache(maxsize=256)
 def validate_hotkey(k: str) -> str:
     keyboard.parse_hotkey(k)
     return k
@@ -3,7 +3,6 @@
 import enum
 import sys
 
-import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
 from pydantic_numpy import np_array_pydantic_annotated_typing
 from pydantic_numpy.model import NumpyModel
@@ -20,6 +19,11 @@ DEPRECATED_INI_KEYS = [
     "move_item_type",
 ]
 
+# Names known to the Dataloader, filled on first validation. The Dataloader data does not change at runtime.
+_AFFIX_SET: frozenset[str] | None = None
+_AFFIX_SIGIL_SET: frozenset[str] | None = None
+_ASPECT_UNIQUE_SET: frozenset[str] | None = None
+
 
 class AspectFilterType(enum.StrEnum):
     all = enum.auto()
@@ -97,9 +101,12 @@ class AffixAspectFilterModel(BaseModel):
 class AffixFilterModel(AffixAspectFilterModel):
     @field_validator("name")
     def name_must_exist(cls, name: str) -> str:
-        from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
+        global _AFFIX_SET
+        if _AFFIX_SET is None:
+            from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
 
-        if name not in Dataloader().affix_dict:
+            _AFFIX_SET = frozenset(Dataloader().affix_dict)
+        if name not in _AFFIX_SET:
             raise ValueError(f"affix {name} does not exist")
         return name
 
@@ -118,12 +125,9 @@ class AffixFilterCountModel(BaseModel):
     @model_validator(mode="after")
     def model_validator(self) -> "AffixFilterCountModel":
         # If minCount and maxCount are not set, we assume that the lengths of the count list is the only thing that matters.
-        # To not show up in the model.dict() we need to remove them from the model_fields_set property
+        # To not show up in the model.dict() they are written to __dict__ directly, which does not add them to model_fields_set
         if "minCount" not in self.model_fields_set and "maxCount" not in self.model_fields_set:
-            self.minCount = len(self.count)
-            self.maxCount = len(self.count)
-            self.model_fields_set.remove("minCount")
-            self.model_fields_set.remove("maxCount")
+            self.__dict__["minCount"] = self.__dict__["maxCount"] = len(self.count)
         if self.minCount > self.maxCount:
             raise ValueError("minCount must be smaller than maxCount")
         if not self.count:
@@ -134,9 +138,12 @@ class AffixFilterCountModel(BaseModel):
 class AspectUniqueFilterModel(AffixAspectFilterModel):
     @field_validator("name")
     def name_must_exist(cls, name: str) -> str:
-        from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
+        global _ASPECT_UNIQUE_SET
+        if _ASPECT_UNIQUE_SET is None:
+            from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
 
-        if name not in Dataloader().aspect_unique_dict:
+            _ASPECT_UNIQUE_SET = frozenset(Dataloader().aspect_unique_dict)
+        if name not in _ASPECT_UNIQUE_SET:
             raise ValueError(f"affix {name} does not exist")
         return name
 
@@ -175,7 +182,8 @@ class AdvancedOptionsModel(_IniBaseModel):
 
     @model_validator(mode="after")
     def key_must_be_unique(self) -> "AdvancedOptionsModel":
-        keys = [
+        seen = set()
+        for key in (
             self.exit_key,
             self.force_refresh_only,
             self.move_to_chest,
@@ -183,9 +191,10 @@ class AdvancedOptionsModel(_IniBaseModel):
             self.run_filter,
             self.run_filter_force_refresh,
             self.run_scripts,
-        ]
-        if len(set(keys)) != len(keys):
-            raise ValueError("hotkeys must be unique")
+        ):
+            if key in seen:
+                raise ValueError("hotkeys must be unique")
+            seen.add(key)
         return self
 
     @field_validator(
@@ -302,8 +311,8 @@ class GeneralModel(_IniBaseModel):
 
 
 class HSVRangeModel(_IniBaseModel):
-    h_s_v_min: np_array_pydantic_annotated_typing(dimensions=1)
-    h_s_v_max: np_array_pydantic_annotated_typing(dimensions=1)
+    h_s_v_min: tuple[int, int, int]
+    h_s_v_max: tuple[int, int, int]
 
     def __getitem__(self, index):
         # TODO added this to not have to change much of the other code. should be fixed some time
@@ -324,9 +333,7 @@ class HSVRangeModel(_IniBaseModel):
         return self
 
     @field_validator("h_s_v_min", "h_s_v_max")
-    def values_in_range(cls, v: np.ndarray) -> np.ndarray:
-        if not len(v) == 3:
-            raise ValueError("must be h,s,v")
+    def values_in_range(cls, v: tuple[int, int, int]) -> tuple[int, int, int]:
         if not -179 <= v[0] <= 179:
             raise ValueError("must be in [-179, 179]")
         if not all(0 <= x <= 255 for x in v[1:3]):
@@ -389,10 +396,13 @@ class SigilConditionModel(BaseModel):
 
     @field_validator("condition", "name")
     def name_must_exist(cls, names_in: str | list[str]) -> str | list[str]:
-        from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
+        global _AFFIX_SIGIL_SET
+        if _AFFIX_SIGIL_SET is None:
+            from src.dataloader import Dataloader  # This on module level would be a circular import, so we do it lazy for now
 
+            _AFFIX_SIGIL_SET = frozenset(Dataloader().affix_sigil_dict)
         names = [names_in] if isinstance(names_in, str) else names_in
-        errors = [name for name in names if name not in Dataloader().affix_sigil_dict]
+        errors = [name for name in names if name not in _AFFIX_SIGIL_SET]
         if errors:
             raise ValueError(f"The following affixes/dungeons do not exist: {errors}")
         return names_in
@@ -1,68 +1,71 @@
+from __future__ import annotations
+
+import atexit
 import datetime
 import functools
 import logging
 import re
 import time
-from collections.abc import Callable
-from typing import Literal, TypeVar
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 import httpx
-from pydantic_yaml import to_yaml_str
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chromium.webdriver import ChromiumDriver
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.wait import WebDriverWait
+import yaml
 
 from src import __version__
 from src.config.loader import IniConfigLoader
 from src.config.models import BrowserType, ProfileModel
+from src.dataloader import Dataloader
 from src.item.data.item_type import ItemType
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    # selenium is only imported when a browser is actually needed, as most importers get along without it
+    from selenium.webdriver.chromium.webdriver import ChromiumDriver
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
 LOGGER = logging.getLogger(__name__)
 
-D = TypeVar("D", bound=WebDriver | WebElement)
+D = TypeVar("D", bound="WebDriver | WebElement")
 T = TypeVar("T")
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
 }
+# Shared so that connections to the same host are kept alive between requests
+HTTP_CLIENT = httpx.Client(limits=httpx.Limits(max_keepalive_connections=10))
+atexit.register(HTTP_CLIENT.close)
+MULTI_UNDERSCORE_PATTERN = re.compile(r"_+")
+NON_DIGIT_PATTERN = re.compile(r"\D+")
+NON_WORD_PATTERN = re.compile(r"\W")
+# Order matters, the first pattern contained in the input wins, e.g. "2h scythe" must be checked before "scythe"
+WEAPON_TYPE_PATTERNS = (
+    ("1h mace", ItemType.Mace),
+    ("2h mace", ItemType.Mace2H),
+    ("1h sword", ItemType.Sword),
+    ("2h sword", ItemType.Sword2H),
+    ("1h axe", ItemType.Axe),
+    ("2h axe", ItemType.Axe2H),
+    ("2h scythe", ItemType.Scythe2H),
+    ("scythe", ItemType.Scythe),
+    ("crossbow", ItemType.Crossbow2H),
+    ("wand", ItemType.Wand),
+    ("staff", ItemType.Staff),
+    ("dagger", ItemType.Dagger),
+    ("bow", ItemType.Bow),
+    ("polearm", ItemType.Polearm),
+)
 
 
 def extract_digits(text: str) -> int:
-    return int("".join([char for char in text if char.isdigit()]))
+    return int(NON_DIGIT_PATTERN.sub("", text))
 
 
 def fix_weapon_type(input_str: str) -> ItemType | None:
     input_str = input_str.lower()
-    if "1h mace" in input_str:
-        return ItemType.Mace
-    if "2h mace" in input_str:
-        return ItemType.Mace2H
-    if "1h sword" in input_str:
-        return ItemType.Sword
-    if "2h sword" in input_str:
-        return ItemType.Sword2H
-    if "1h axe" in input_str:
-        return ItemType.Axe
-    if "2h axe" in input_str:
-        return ItemType.Axe2H
-    if "2h scythe" in input_str:
-        return ItemType.Scythe2H
-    if "scythe" in input_str:
-        return ItemType.Scythe
-    if "crossbow" in input_str:
-        return ItemType.Crossbow2H
-    if "wand" in input_str:
-        return ItemType.Wand
-    if "staff" in input_str:
-        return ItemType.Staff
-    if "dagger" in input_str:
-        return ItemType.Dagger
-    if "bow" in input_str:
-        return ItemType.Bow
-    if "polearm" in input_str:
-        return ItemType.Polearm
+    for pattern, item_type in WEAPON_TYPE_PATTERNS:
+        if pattern in input_str:
+            return item_type
     return None
 
 
@@ -103,21 +106,34 @@ def get_class_name(input_str: str) -> str:
 
 
 def get_with_retry(url: str, custom_headers: dict[str, str] | None = None) -> httpx.Response:
-    for _ in range(10):
+    backoff = 0.25
+    for attempt in range(1, 11):
         try:
-            r = httpx.get(url, headers=custom_headers if custom_headers is not None else HEADERS)
+            r = HTTP_CLIENT.get(url, headers=custom_headers if custom_headers is not None else HEADERS)
         except httpx.RequestError:
             LOGGER.debug(f"Request {url} timed out, retrying...")
-            continue
-        if r.status_code != 200:
+        else:
+            if r.status_code == 200:
+                return r
+            # Client errors like a 404 for a mistyped url will not go away by retrying
+            if 400 <= r.status_code < 500 and r.status_code != 429:
+                LOGGER.error(msg := f"Request {url} failed with status code {r.status_code}")
+                raise ConnectionError(msg)
             LOGGER.debug(f"Request {url} failed with status code {r.status_code}, retrying...")
-            continue
-        return r
+            if r.status_code < 400:
+                continue
+        # Only back off on connection errors, rate limiting and server errors, and not after the last attempt
+        if attempt < 10:
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 5)
     LOGGER.error(msg := f"Failed to get a successful response after 10 attempts: {url=}")
     raise ConnectionError(msg)
 
 
 def handle_popups(driver: ChromiumDriver, method: Callable[[D], Literal[False] | T], timeout=10):
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.wait import WebDriverWait
+
     LOGGER.info("Handling cookie / adblock popups")
     wait = WebDriverWait(driver, timeout)
     for _ in range(3):
@@ -130,30 +146,27 @@ def handle_popups(driver: ChromiumDriver, method: Callable[[D], Literal[False] |
 
 
 def match_to_enum(enum_class, target_string: str, check_keys: bool = False):
-    target_string = target_string.casefold().replace(" ", "").replace("-", "")
-    for enum_member in enum_class:
-        if enum_member.value.casefold().replace(" ", "").replace("-", "") == target_string:
-            return enum_member
-        if check_keys and enum_member.name.casefold().replace(" ", "").replace("-", "") == target_string:
-            return enum_member
-    return None
+    return _normalized_enum_map(enum_class, check_keys).get(_normalize_enum_str(target_string))
 
 
 def retry_importer(func=None, inject_webdriver: bool = False):
     def decorator_retry_importer(wrap_function):
         @functools.wraps(wrap_function)
         def wrapper(*args, **kwargs):
+            # The driver is shared by all attempts and only quit here if it was created here
+            injected_driver = None
             if inject_webdriver and "driver" not in kwargs and not args:
-                kwargs["driver"] = setup_webdriver()
-            for _ in range(5):
-                try:
-                    res = wrap_function(*args, **kwargs)
-                    if inject_webdriver:
-                        kwargs["driver"].quit()
-                    return res
-                except Exception:
-                    LOGGER.exception("An error occurred while importing. Retrying...")
-            return None
+                kwargs["driver"] = injected_driver = setup_webdriver()
+            try:
+                for _ in range(5):
+                    try:
+                        return wrap_function(*args, **kwargs)
+                    except Exception:
+                        LOGGER.exception("An error occurred while importing. Retrying...")
+                return None
+            finally:
+                if injected_driver is not None:
+                    injected_driver.quit()
 
         return wrapper
 
@@ -162,25 +175,26 @@ def retry_importer(func=None, inject_webdriver: bool = False):
 
 def save_as_profile(file_name: str, profile: ProfileModel, url: str):
     file_name = file_name.replace("'", "")
-    file_name = re.sub(r"\W", "_", file_name)
-    file_name = re.sub(r"_+", "_", file_name).rstrip("_")
+    file_name = NON_WORD_PATTERN.sub("_", file_name)
+    file_name = MULTI_UNDERSCORE_PATTERN.sub("_", file_name).rstrip("_")
     save_path = IniConfigLoader().user_dir / f"profiles/{file_name}.yaml"
     save_path.parent.mkdir(parents=True, exist_ok=True)
     with open(save_path, "w", encoding="utf-8") as file:
         file.write(f"# {url}\n")
         file.write(f"# {datetime.datetime.now(tz=datetime.UTC).strftime("%Y-%m-%d %H:%M:%S")} (v{__version__})\n")
-        file.write(
-            to_yaml_str(
-                profile,
-                default_flow_style=None,
-                exclude_unset=not IniConfigLoader().general.full_dump,
-                exclude=["name", "Sigils", "Uniques"],
-            )
+        yaml.dump(
+            profile.model_dump(mode="json", exclude_unset=not IniConfigLoader().general.full_dump, exclude={"name", "Sigils", "Uniques"}),
+            file,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),  # The C emitter is only available if PyYAML was built with libyaml
+            allow_unicode=True,
+            default_flow_style=None,
         )
     LOGGER.info(f"Created profile {save_path}")
 
 
 def setup_webdriver() -> ChromiumDriver:
+    from selenium import webdriver
+
     match IniConfigLoader().general.browser:
         case BrowserType.edge:
             options = webdriver.EdgeOptions()
@@ -198,3 +212,18 @@ def setup_webdriver() -> ChromiumDriver:
             options.add_argument("log-level=3")
             driver = webdriver.Firefox(options=options)
     return driver  # noqa # It must be one of the 3 browsers due to ini validation
+
+
+@functools.cache
+def _normalized_enum_map(enum_class, check_keys: bool) -> dict:
+    Dataloader()  # Enum values like ItemType are overwritten by the Dataloader, so they must be loaded before building the map
+    result = {}
+    for enum_member in enum_class:
+        result.setdefault(_normalize_enum_str(enum_member.value), enum_member)
+        if check_keys:
+            result.setdefault(_normalize_enum_str(enum_member.name), enum_member)
+    return result
+
+
+def _normalize_enum_str(s: str) -> str:
+    return s.casefold().replace(" ", "").replace("-", "")
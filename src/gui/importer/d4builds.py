@@ -1,13 +1,12 @@
+from __future__ import annotations
+
 import datetime
 import logging
 import re
 import time
+from typing import TYPE_CHECKING
 
 import lxml.html
-from selenium.webdriver.chromium.webdriver import ChromiumDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 
 import src.logger
 from src.config.models import AffixFilterCountModel, AffixFilterModel, ItemFilterModel, ProfileModel
@@ -24,6 +23,9 @@ from src.item.data.affix import Affix
 from src.item.data.item_type import ItemType
 from src.item.descr.text import clean_str, closest_match
 
+if TYPE_CHECKING:
+    from selenium.webdriver.chromium.webdriver import ChromiumDriver
+
 LOGGER = logging.getLogger(__name__)
 
 BASE_URL = "https://d4builds.gg/builds"
@@ -45,6 +47,11 @@ class D4BuildsException(Exception):
 
 @retry_importer(inject_webdriver=True)
 def import_d4builds(driver: ChromiumDriver = None, url: str = None):
+    # selenium is imported here so that loading the gui does not load it before a d4builds import is started
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.wait import WebDriverWait
+
     url = url.strip().replace("\n", "")
     if BASE_URL not in url:
         LOGGER.error("Invalid url, please use a d4builds url")
@@ -5,7 +5,6 @@ import time
 import traceback
 
 import keyboard
-from beautifultable import BeautifulTable
 from PIL import Image  # noqa #  Note: Somehow needed, otherwise the binary has an issue with tesserocr
 
 import src.logger
@@ -13,7 +12,6 @@ from src import __version__
 from src.cam import Cam
 from src.config.loader import IniConfigLoader
 from src.config.models import ItemRefreshType
-from src.gui.qt_gui import start_gui
 from src.item.filter import Filter
 from src.logger import LOG_DIR
 from src.overlay import Overlay
@@ -24,61 +22,76 @@ LOGGER = logging.getLogger(__name__)
 
 
 def main():
+    advanced_options = IniConfigLoader().advanced_options
+    user_dir = IniConfigLoader().user_dir
+
     # Create folders for logging stuff
-    for dir_name in [LOG_DIR / "screenshots", IniConfigLoader().user_dir, IniConfigLoader().user_dir / "profiles"]:
+    for dir_name in [LOG_DIR / "screenshots", user_dir, user_dir / "profiles"]:
         os.makedirs(dir_name, exist_ok=True)
 
-    LOGGER.info(f"Adapt your configs via gui.bat or directly in: {IniConfigLoader().user_dir}")
+    LOGGER.info(f"Adapt your configs via gui.bat or directly in: {user_dir}")
 
-    if IniConfigLoader().advanced_options.vision_mode_only:
+    if advanced_options.vision_mode_only:
         LOGGER.info("Vision mode only is enabled. All functionality that clicks the screen is disabled.")
 
     Filter().load_files()
 
     print(f"============ D4 Loot Filter {__version__} ============")
-    table = BeautifulTable()
-    table.set_style(BeautifulTable.STYLE_BOX_ROUNDED)
-    table.rows.append([IniConfigLoader().advanced_options.run_scripts, "Run/Stop Vision Filter"])
-    if not IniConfigLoader().advanced_options.vision_mode_only:
-        table.rows.append([IniConfigLoader().advanced_options.run_filter, "Run/Stop Auto Filter"])
-        table.rows.append([IniConfigLoader().advanced_options.run_filter_force_refresh, "Force Run/Stop Filter, Resetting Item Status"])
-        table.rows.append([IniConfigLoader().advanced_options.force_refresh_only, "Reset Item Statuses Without A Filter After"])
-        table.rows.append([IniConfigLoader().advanced_options.move_to_inv, "Move Items From Chest To Inventory"])
-        table.rows.append([IniConfigLoader().advanced_options.move_to_chest, "Move Items From Inventory To Chest"])
-    table.rows.append([IniConfigLoader().advanced_options.exit_key, "Exit"])
-    table.columns.header = ["hotkey", "action"]
-    print(table)
+    rows = [[advanced_options.run_scripts, "Run/Stop Vision Filter"]]
+    if not advanced_options.vision_mode_only:
+        rows.append([advanced_options.run_filter, "Run/Stop Auto Filter"])
+        rows.append([advanced_options.run_filter_force_refresh, "Force Run/Stop Filter, Resetting Item Status"])
+        rows.append([advanced_options.force_refresh_only, "Reset Item Statuses Without A Filter After"])
+        rows.append([advanced_options.move_to_inv, "Move Items From Chest To Inventory"])
+        rows.append([advanced_options.move_to_chest, "Move Items From Inventory To Chest"])
+    rows.append([advanced_options.exit_key, "Exit"])
+    print(_format_table(header=["hotkey", "action"], rows=rows))
     print("\n")
 
-    win_spec = WindowSpec(IniConfigLoader().advanced_options.process_name)
+    win_spec = WindowSpec(advanced_options.process_name)
     start_detecting_window(win_spec)
     while not Cam().is_offset_set():
         time.sleep(0.2)
 
     overlay = None
 
-    keyboard.add_hotkey(IniConfigLoader().advanced_options.run_scripts, lambda: overlay.run_scripts() if overlay is not None else None)
-    keyboard.add_hotkey(IniConfigLoader().advanced_options.exit_key, lambda: safe_exit())
-    if not IniConfigLoader().advanced_options.vision_mode_only:
-        keyboard.add_hotkey(IniConfigLoader().advanced_options.run_filter, lambda: overlay.filter_items() if overlay is not None else None)
+    keyboard.add_hotkey(advanced_options.run_scripts, lambda: overlay.run_scripts() if overlay is not None else None)
+    keyboard.add_hotkey(advanced_options.exit_key, lambda: safe_exit())
+    if not advanced_options.vision_mode_only:
+        keyboard.add_hotkey(advanced_options.run_filter, lambda: overlay.filter_items() if overlay is not None else None)
         keyboard.add_hotkey(
-            IniConfigLoader().advanced_options.run_filter_force_refresh,
+            advanced_options.run_filter_force_refresh,
             lambda: overlay.filter_items(ItemRefreshType.force_with_filter) if overlay is not None else None,
         )
         keyboard.add_hotkey(
-            IniConfigLoader().advanced_options.force_refresh_only,
+            advanced_options.force_refresh_only,
             lambda: overlay.filter_items(ItemRefreshType.force_without_filter) if overlay is not None else None,
         )
-        keyboard.add_hotkey(IniConfigLoader().advanced_options.move_to_inv, lambda: overlay.move_items_to_inventory())
-        keyboard.add_hotkey(IniConfigLoader().advanced_options.move_to_chest, lambda: overlay.move_items_to_stash())
+        keyboard.add_hotkey(advanced_options.move_to_inv, lambda: overlay.move_items_to_inventory())
+        keyboard.add_hotkey(advanced_options.move_to_chest, lambda: overlay.move_items_to_stash())
 
     overlay = Overlay()
     overlay.run()
 
 
+def _format_table(header: list[str], rows: list[list[str]]) -> str:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+
+    def _line(left: str, mid: str, right: str) -> str:
+        return left + mid.join("─" * (w + 2) for w in widths) + right
+
+    def _row(row: list[str]) -> str:
+        return "│" + "│".join(f" {cell:^{w}} " for cell, w in zip(row, widths, strict=True)) + "│"
+
+    separator = "\n" + _line("├", "┼", "┤") + "\n"
+    return "\n".join([_line("╭", "┬", "╮"), separator.join(_row(row) for row in [header, *rows]), _line("╰", "┴", "╯")])
+
+
 if __name__ == "__main__":
     src.logger.setup(log_level=IniConfigLoader().advanced_options.log_lvl.value)
     if len(sys.argv) > 1 and sys.argv[1] == "--gui":
+        from src.gui.qt_gui import start_gui  # Lazy, so that running without the gui does not load Qt, selenium and the importers
+
         start_gui()
     try:
         main()
@@ -1,10 +1,13 @@
 import logging
-from copy import deepcopy
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import cv2
 import numpy as np
 
+if TYPE_CHECKING:
+    from src.config.models import HSVRangeModel
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -118,32 +121,25 @@ def create_mask(size: tuple[int, int], roi: tuple[int, int, int, int]) -> np.nda
     return img
 
 
-def color_filter(img: np.ndarray, color_range: list[np.ndarray], calc_filtered_img: bool = True) -> tuple[np.ndarray, np.ndarray | None]:
+def color_filter(
+    img: np.ndarray, color_range: "HSVRangeModel | list[tuple[int, int, int]]", calc_filtered_img: bool = True
+) -> tuple[np.ndarray, np.ndarray | None]:
     color_ranges = []
-    # ex: [array([ -9, 201,  25]), array([ 9, 237,  61])]
-    if color_range[0][0] < 0:
-        lower_range = deepcopy(color_range)
-        lower_range[0][0] = 0
-        color_ranges.append(lower_range)
-        upper_range = deepcopy(color_range)
-        upper_range[0][0] = 180 + color_range[0][0]
-        upper_range[1][0] = 180
-        color_ranges.append(upper_range)
-    # ex: [array([ 170, 201,  25]), array([ 188, 237,  61])]
-    elif color_range[1][0] > 180:
-        upper_range = deepcopy(color_range)
-        upper_range[1][0] = 180
-        color_ranges.append(upper_range)
-        lower_range = deepcopy(color_range)
-        lower_range[0][0] = 0
-        lower_range[1][0] = color_range[1][0] - 180
-        color_ranges.append(lower_range)
+    lower, upper = color_range[0], color_range[1]
+    # ex: [( -9, 201,  25), ( 9, 237,  61)]
+    if lower[0] < 0:
+        color_ranges.append(((0, *lower[1:]), upper))
+        color_ranges.append(((180 + lower[0], *lower[1:]), (180, *upper[1:])))
+    # ex: [( 170, 201,  25), ( 188, 237,  61)]
+    elif upper[0] > 180:
+        color_ranges.append((lower, (180, *upper[1:])))
+        color_ranges.append(((0, *lower[1:]), (upper[0] - 180, *upper[1:])))
     else:
-        color_ranges.append(color_range)
+        color_ranges.append((lower, upper))
     color_masks = []
     hsv_img = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
     for color_range in color_ranges:
-        mask = cv2.inRange(hsv_img, color_range[0], color_range[1])
+        mask = cv2.inRange(hsv_img, np.asarray(color_range[0]), np.asarray(color_range[1]))
         color_masks.append(mask)
     color_mask = np.bitwise_or.reduce(color_masks) if len(color_masks) > 0 else color_masks[0]
     if calc_filtered_img:
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 import cv2
 import numpy as np
 import psutil
-from win32gui import ClientToScreen, EnumWindows, GetClientRect, GetWindowText
+from win32gui import ClientToScreen, EnumWindows, GetClientRect, GetWindowText, IsWindow
 from win32process import GetWindowThreadProcessId
 
 from src.cam import Cam
@@ -16,8 +16,9 @@ from src.logger import LOG_DIR
 
 LOGGER = logging.getLogger(__name__)
 
-DETECTION_WINDOW_FLAG = True
+DETECT_WINDOW_STOP_EVENT = threading.Event()
 DETECT_WINDOW_THREAD = None
+LAST_WINDOW_ID = None
 
 # Set the process DPI aware
 try:
@@ -45,12 +46,23 @@ def _list_active_window_ids() -> list[int]:
 
 
 def get_window_spec_id(window_spec: WindowSpec) -> int | None:
+    global LAST_WINDOW_ID
+    # Checking the last found window is much cheaper than looking up the process of every open window.
+    # It is called from several threads, so the global is only read and written once per call
+    last_window_id = LAST_WINDOW_ID
+    if last_window_id is not None and IsWindow(last_window_id) and window_spec.match(last_window_id):
+        return last_window_id
+    LAST_WINDOW_ID = window_id = _find_window_spec_id(window_spec)
+    if window_id is not None:
+        return window_id
+    # If no process was found with "diablo" in the window name, search without that restriction.
+    # That window is not cached, as it can be a helper window of the game which must not win over the real one
+    return _find_window_spec_id(window_spec, check_window_name=False)
+
+
+def _find_window_spec_id(window_spec: WindowSpec, check_window_name: bool = True) -> int | None:
     for hwnd in _list_active_window_ids():
-        if window_spec.match(hwnd):
-            return hwnd
-    # If no process was found with "diablo" in the window name, search without that restriction
-    for hwnd in _list_active_window_ids():
-        if window_spec.match(hwnd, check_window_name=False):
+        if window_spec.match(hwnd, check_window_name=check_window_name):
             return hwnd
     return None
 
@@ -68,18 +80,19 @@ def _get_process_from_window_name(hwnd: int) -> str:
 
 
 def start_detecting_window(window_spec: WindowSpec):
-    global DETECTION_WINDOW_FLAG, DETECT_WINDOW_THREAD
+    global DETECT_WINDOW_THREAD
     if DETECT_WINDOW_THREAD is None:
         LOGGER.info(f"Using WinAPI to search for window: {window_spec.process_name}")
-        DETECTION_WINDOW_FLAG = True
+        DETECT_WINDOW_STOP_EVENT.clear()
         DETECT_WINDOW_THREAD = threading.Thread(target=detect_window, args=(window_spec,), daemon=True)
         DETECT_WINDOW_THREAD.start()
 
 
 def detect_window(window_spec: WindowSpec):
-    global DETECTION_WINDOW_FLAG
-    while DETECTION_WINDOW_FLAG:
+    # Waiting on the event instead of sleeping lets stop_detecting_window return right away
+    while not DETECT_WINDOW_STOP_EVENT.is_set():
         find_and_set_window_position(window_spec)
+        DETECT_WINDOW_STOP_EVENT.wait(1)
     LOGGER.debug("Detect window thread stopped")
 
 
@@ -89,12 +102,11 @@ def find_and_set_window_position(window_spec: WindowSpec):
         pos = GetClientRect(hwnd)
         top_left = ClientToScreen(hwnd, (pos[0], pos[1]))
         Cam().update_window_pos(top_left[0], top_left[1], pos[2], pos[3])
-    time.sleep(1)
 
 
 def stop_detecting_window():
-    global DETECTION_WINDOW_FLAG, DETECT_WINDOW_THREAD
-    DETECTION_WINDOW_FLAG = False
+    global DETECT_WINDOW_THREAD
+    DETECT_WINDOW_STOP_EVENT.set()
     if DETECT_WINDOW_THREAD:
         DETECT_WINDOW_THREAD.join()
     DETECT_WINDOW_THREAD = None
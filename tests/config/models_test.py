@@ -1,12 +1,30 @@
+import sys
 from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from src.config.models import ProfileModel
+from src.config.models import AffixFilterCountModel, ProfileModel
 from tests.config.data import sigils, uniques
 
 
+class TestAffixFilterCount:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mock_ini_loader):
+        self.mock_ini_loader = mock_ini_loader
+
+    def test_counts_default_to_count_length(self):
+        model = AffixFilterCountModel(count=["armor", "attack_speed"])
+        assert model.minCount == model.maxCount == 2
+        assert model.model_fields_set == {"count"}
+        assert model.model_dump(exclude_unset=True) == {"count": [{"name": "armor"}, {"name": "attack_speed"}]}
+
+    def test_explicit_counts_are_kept(self):
+        model = AffixFilterCountModel(count=["armor", "attack_speed"], minCount=1)
+        assert (model.minCount, model.maxCount) == (1, sys.maxsize)
+        assert model.model_fields_set == {"count", "minCount"}
+
+
 class TestSigil:
     @pytest.fixture(autouse=True)
     def _setup(self, mock_ini_loader):
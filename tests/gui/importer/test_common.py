@@ -0,0 +1,67 @@
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from src.gui.importer import common
+from src.gui.importer.common import get_with_retry
+
+URL = "https://example.com/data.json"
+
+
+@pytest.fixture()
+def sleep_mock(mocker: MockerFixture):
+    return mocker.patch("src.gui.importer.common.time.sleep")
+
+
+def _patch_client(mocker: MockerFixture, responses: list) -> list[httpx.Request]:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return httpx.Response(response)
+
+    mocker.patch.object(common, "HTTP_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    return requests
+
+
+def test_get_with_retry_success(mocker: MockerFixture, sleep_mock):
+    requests = _patch_client(mocker, [200])
+    assert get_with_retry(URL).status_code == 200
+    assert len(requests) == 1
+    sleep_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("status_code", [400, 403, 404])
+def test_get_with_retry_client_error_fails_fast(mocker: MockerFixture, sleep_mock, status_code: int):
+    requests = _patch_client(mocker, [status_code])
+    with pytest.raises(ConnectionError):
+        get_with_retry(URL)
+    assert len(requests) == 1
+    sleep_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("response", [429, 500, 503, httpx.ConnectError("connection refused")])
+def test_get_with_retry_backs_off(mocker: MockerFixture, sleep_mock, response):
+    requests = _patch_client(mocker, [response, response, 200])
+    assert get_with_retry(URL).status_code == 200
+    assert len(requests) == 3
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.25, 0.5]
+
+
+def test_get_with_retry_no_backoff_without_error(mocker: MockerFixture, sleep_mock):
+    requests = _patch_client(mocker, [204, 200])
+    assert get_with_retry(URL).status_code == 200
+    assert len(requests) == 2
+    sleep_mock.assert_not_called()
+
+
+def test_get_with_retry_gives_up(mocker: MockerFixture, sleep_mock):
+    requests = _patch_client(mocker, [429])
+    with pytest.raises(ConnectionError):
+        get_with_retry(URL)
+    assert len(requests) == 10
+    # No pointless sleep after the last attempt
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [0.25, 0.5, 1, 2, 4, 5, 5, 5, 5]
@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 import pytest
 
@@ -127,6 +128,22 @@ def test_color_filter_with_img(filter_img, color_range):
     assert isinstance(img, np.ndarray)
 
 
+@pytest.mark.parametrize(
+    ("color_range", "expected_ranges"),
+    [
+        # negative lower hue wraps around to the end of the hue range
+        ([(-9, 50, 25), (9, 237, 200)], [((0, 50, 25), (9, 237, 200)), ((171, 50, 25), (180, 237, 200))]),
+        # upper hue above 180 wraps around to the start of the hue range
+        ([(170, 20, 25), (188, 237, 255)], [((170, 20, 25), (180, 237, 255)), ((0, 20, 25), (8, 237, 255))]),
+    ],
+)
+def test_color_filter_hue_wrap_around(filter_img, color_range, expected_ranges):
+    color_mask, _ = color_filter(filter_img, color_range, calc_filtered_img=False)
+    hsv_img = cv2.cvtColor(filter_img, cv2.COLOR_BGR2HSV)
+    expected_mask = np.bitwise_or.reduce([cv2.inRange(hsv_img, np.array(lower), np.array(upper)) for lower, upper in expected_ranges])
+    assert np.array_equal(color_mask, expected_mask)
+
+
 def test_overlay_image():
     # Create two sample images of size 10x10
     image1 = np.zeros((10, 10, 3), dtype=np.uint8)